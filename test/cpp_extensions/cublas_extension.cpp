@@ -4,11 +4,38 @@
 #include <ATen/cuda/CUDAContext.h>
 
 #include <cublas_v2.h>
+#include <dlfcn.h>
+
+// libcublas is deliberately not linked at load time: importing this extension
+// should not map the (large) cuBLAS shared object into the process. It is
+// dlopened on first use instead and the few symbols needed are resolved once
+// with dlsym.
+using cublasCreateFn = cublasStatus_t (*)(cublasHandle_t*);
+using cublasDestroyFn = cublasStatus_t (*)(cublasHandle_t);
+
+static void* cublas_library() {
+  static void* library = []() -> void* {
+    for (const char* name :
+         {"libcublas.so", "libcublas.so.12", "libcublas.so.11"}) {
+      if (void* handle = dlopen(name, RTLD_LAZY | RTLD_LOCAL)) {
+        return handle;
+      }
+    }
+    TORCH_CHECK(false, "could not dlopen libcublas: ", dlerror());
+  }();
+  return library;
+}
 
 torch::Tensor noop_cublas_function(torch::Tensor x) {
+  static auto create = reinterpret_cast<cublasCreateFn>(
+      dlsym(cublas_library(), "cublasCreate_v2"));
+  static auto destroy = reinterpret_cast<cublasDestroyFn>(
+      dlsym(cublas_library(), "cublasDestroy_v2"));
+  TORCH_CHECK(create != nullptr, "could not resolve cublasCreate_v2");
+  TORCH_CHECK(destroy != nullptr, "could not resolve cublasDestroy_v2");
   cublasHandle_t handle;
-  TORCH_CUDABLAS_CHECK(cublasCreate(&handle));
-  TORCH_CUDABLAS_CHECK(cublasDestroy(handle));
+  TORCH_CUDABLAS_CHECK(create(&handle));
+  TORCH_CUDABLAS_CHECK(destroy(handle));
   return x;
 }
 
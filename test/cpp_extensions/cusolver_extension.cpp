@@ -2,12 +2,37 @@
 #include <ATen/cuda/CUDAContext.h>
 
 #include <cusolverDn.h>
+#include <dlfcn.h>
 
+// As with the cublas extension, libcusolver is dlopened on first use rather
+// than linked at load time, so importing this extension does not pull the
+// several-hundred-MB cuSOLVER shared object into process RSS.
+using cusolverDnCreateFn = cusolverStatus_t (*)(cusolverDnHandle_t*);
+using cusolverDnDestroyFn = cusolverStatus_t (*)(cusolverDnHandle_t);
+
+static void* cusolver_library() {
+  static void* library = []() -> void* {
+    for (const char* name :
+         {"libcusolver.so", "libcusolver.so.11", "libcusolver.so.10"}) {
+      if (void* handle = dlopen(name, RTLD_LAZY | RTLD_LOCAL)) {
+        return handle;
+      }
+    }
+    TORCH_CHECK(false, "could not dlopen libcusolver: ", dlerror());
+  }();
+  return library;
+}
 
 torch::Tensor noop_cusolver_function(torch::Tensor x) {
+  static auto create = reinterpret_cast<cusolverDnCreateFn>(
+      dlsym(cusolver_library(), "cusolverDnCreate"));
+  static auto destroy = reinterpret_cast<cusolverDnDestroyFn>(
+      dlsym(cusolver_library(), "cusolverDnDestroy"));
+  TORCH_CHECK(create != nullptr, "could not resolve cusolverDnCreate");
+  TORCH_CHECK(destroy != nullptr, "could not resolve cusolverDnDestroy");
   cusolverDnHandle_t handle;
-  TORCH_CUSOLVER_CHECK(cusolverDnCreate(&handle));
-  TORCH_CUSOLVER_CHECK(cusolverDnDestroy(handle));
+  TORCH_CUSOLVER_CHECK(create(&handle));
+  TORCH_CUSOLVER_CHECK(destroy(handle));
   return x;
 }
 
@@ -42,14 +42,42 @@ PYBIND11_MODULE(TORCH_EXTENSION_NAME, m) {
       .def("forward", &MatrixMultiplier::forward)
       .def("get", &MatrixMultiplier::get);
 
-  m.def("get_complex", []() { return c10::complex<double>(1.0, 2.0); });
-  m.def("get_device", []() { return at::device_of(random_tensor()).value(); });
-  m.def("get_generator", []() { return at::detail::getDefaultCPUGenerator(); });
+  // These bodies never touch python objects (the type casters run after the
+  // call, once pybind has reacquired the GIL), so release the GIL while they
+  // execute. The *arrayref getters keep it held since their casters build
+  // python lists from a borrowed range.
+  m.def(
+      "get_complex",
+      []() { return c10::complex<double>(1.0, 2.0); },
+      py::call_guard<py::gil_scoped_release>());
+  m.def(
+      "get_device",
+      []() { return at::device_of(random_tensor()).value(); },
+      py::call_guard<py::gil_scoped_release>());
+  m.def(
+      "get_generator",
+      []() { return at::detail::getDefaultCPUGenerator(); },
+      py::call_guard<py::gil_scoped_release>());
   m.def("get_intarrayref", []() { return at::IntArrayRef({1, 2, 3}); });
-  m.def("get_memory_format", []() { return c10::get_contiguous_memory_format(); });
-  m.def("get_storage", []() { return random_tensor().storage(); });
-  m.def("get_symfloat", []() { return c10::SymFloat(1.0); });
-  m.def("get_symint", []() { return c10::SymInt(1); });
+  m.def(
+      "get_memory_format",
+      []() { return c10::get_contiguous_memory_format(); },
+      py::call_guard<py::gil_scoped_release>());
+  m.def(
+      "get_storage",
+      []() { return random_tensor().storage(); },
+      py::call_guard<py::gil_scoped_release>());
+  m.def(
+      "get_symfloat",
+      []() { return c10::SymFloat(1.0); },
+      py::call_guard<py::gil_scoped_release>());
+  m.def(
+      "get_symint",
+      []() { return c10::SymInt(1); },
+      py::call_guard<py::gil_scoped_release>());
   m.def("get_symintarrayref", []() { return at::SymIntArrayRef({1, 2, 3}); });
-  m.def("get_tensor", []() { return random_tensor(); });
+  m.def(
+      "get_tensor",
+      []() { return random_tensor(); },
+      py::call_guard<py::gil_scoped_release>());
 }
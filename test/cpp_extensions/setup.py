@@ -17,6 +17,18 @@ else:
 
 USE_NINJA = os.getenv('USE_NINJA') == '1'
 
+CUDA_VERSION = (
+    tuple(int(v) for v in torch.version.cuda.split('.')[:2])
+    if torch.version.cuda is not None else None
+)
+
+NVCC_FLAGS = ['-O2']
+if CUDA_VERSION is not None and CUDA_VERSION >= (11, 2):
+    # `nvcc --threads N` compiles for the archs in TORCH_CUDA_ARCH_LIST in
+    # parallel within a single .cu file; it is a no-op under single-arch
+    # builds.
+    NVCC_FLAGS.append('--threads=' + os.environ.get('NVCC_THREADS', '4'))
+
 ext_modules = [
     CppExtension(
         'torch_test_cpp_extension.cpp', ['extension.cpp'],
@@ -37,7 +49,7 @@ if torch.cuda.is_available() and (CUDA_HOME is not None or ROCM_HOME is not None
             'cuda_extension_kernel2.cu',
         ],
         extra_compile_args={'cxx': CXX_FLAGS,
-                            'nvcc': ['-O2']})
+                            'nvcc': NVCC_FLAGS})
     ext_modules.append(extension)
 
 if torch.cuda.is_available() and (CUDA_HOME is not None or ROCM_HOME is not None):
@@ -46,27 +58,37 @@ if torch.cuda.is_available() and (CUDA_HOME is not None or ROCM_HOME is not None
             'torch_library.cu'
         ],
         extra_compile_args={'cxx': CXX_FLAGS,
-                            'nvcc': ['-O2']})
+                            'nvcc': NVCC_FLAGS})
     ext_modules.append(extension)
 
 # todo(mkozuki): Figure out the root cause
 if (not IS_WINDOWS) and torch.cuda.is_available() and CUDA_HOME is not None:
     # malfet: One should not assume that PyTorch re-exports CUDA dependencies
+    # cublas/cusolver are dlopened lazily inside the extensions rather than
+    # linked, so importing them does not map the libraries into the process.
     cublas_extension = CUDAExtension(
         name='torch_test_cpp_extension.cublas_extension',
         sources=['cublas_extension.cpp'],
-        libraries=['cublas'] if torch.version.hip is None else [],
     )
     ext_modules.append(cublas_extension)
 
     cusolver_extension = CUDAExtension(
         name='torch_test_cpp_extension.cusolver_extension',
         sources=['cusolver_extension.cpp'],
-        libraries=['cusolver'] if torch.version.hip is None else [],
     )
     ext_modules.append(cusolver_extension)
 
 if USE_NINJA and (not IS_WINDOWS) and torch.cuda.is_available() and CUDA_HOME is not None:
+    DLINK_NVCC_FLAGS = NVCC_FLAGS + ['-dc']
+    # Device link time optimization recovers the cross-file inlining that
+    # relocatable device code otherwise loses. CUDAExtension already passes
+    # -dlto at the dlink step on CUDA >= 11.2, but it only helps when the
+    # per-file compile step emits NVVM IR as well.
+    if CUDA_VERSION is not None and CUDA_VERSION >= (11, 2):
+        DLINK_NVCC_FLAGS.append('-dlto')
+    # dlink=True is deliberately scoped to this one extension: the other CUDA
+    # extensions are not built with relocatable device code, so their modules
+    # load as a single cubin without any device-linker (CUlinkState) work.
     extension = CUDAExtension(
         name='torch_test_cpp_extension.cuda_dlink',
         sources=[
@@ -76,7 +98,7 @@ if USE_NINJA and (not IS_WINDOWS) and torch.cuda.is_available() and CUDA_HOME is
         ],
         dlink=True,
         extra_compile_args={'cxx': CXX_FLAGS,
-                            'nvcc': ['-O2', '-dc']})
+                            'nvcc': DLINK_NVCC_FLAGS})
     ext_modules.append(extension)
 
 setup(
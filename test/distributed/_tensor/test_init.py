@@ -100,6 +100,18 @@ class DTensorConstructorTest(DTensorTestBase):
         elif self.rank == 3:
             self.assertEqual(local_tensor, torch.zeros([15, 1]))
 
+    @with_comms
+    def test_zeros_default_placements(self):
+        # construct a cuda device 1d mesh
+        mesh = DeviceMesh(self.device_type, torch.arange(self.world_size))
+        size = [32, 3]
+        dist_tensor = zeros(size, device_mesh=mesh)
+        # default placements must compare equal to a replicate list literal,
+        # matching the placements of DTensors built via from_local and friends
+        self.assertTrue(dist_tensor.placements == [Replicate()] * mesh.ndim)
+        self.assertEqual(dist_tensor.size(), torch.Size(size))
+        self.assertEqual(dist_tensor.to_local(), torch.zeros(size))
+
     @with_comms
     def test_zeros_submesh(self):
         # default world_size is 4
@@ -3,6 +3,7 @@
 import argparse
 import copy
 import glob
+import hashlib
 import json
 import os
 import pathlib
@@ -12,6 +13,7 @@ import subprocess
 import sys
 import tempfile
 from datetime import datetime
+from multiprocessing.pool import ThreadPool
 from distutils.version import LooseVersion
 from typing import Any, cast, Dict, List, Optional
 
@@ -587,6 +589,58 @@ def run_test_with_subprocess(test_module, test_directory, options):
     )
 
 
+def _toolchain_version(cmd):
+    """Best-effort version banner of a toolchain binary; empty if missing."""
+    try:
+        return subprocess.check_output(cmd, stderr=subprocess.STDOUT).decode(
+            errors="replace"
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def _cpp_extensions_aot_build_stamp(ext_dir, shell_env):
+    """Content hash of everything that can invalidate a prebuilt AOT test
+    extension: the sources under ext_dir plus the torch/toolchain config the
+    build depends on. If the stamp is unchanged, the built .so can be reused.
+    """
+    hasher = hashlib.sha256()
+    hasher.update(torch.__version__.encode())
+    hasher.update(str(torch.version.cuda).encode())
+    hasher.update(shell_env.get("USE_NINJA", "").encode())
+    hasher.update(shell_env.get("TORCH_CUDA_ARCH_LIST", "").encode())
+    # The host compiler (and nvcc) identity must be part of the key: a warm
+    # worker whose toolchain image changed would otherwise reuse a stale,
+    # ABI-mismatched .so that only fails later at import time.
+    compiler = shell_env.get("CXX", "cl" if sys.platform == "win32" else "c++")
+    hasher.update(compiler.encode())
+    hasher.update(_toolchain_version([compiler, "--version"]).encode())
+    if torch.version.cuda is not None:
+        hasher.update(_toolchain_version(["nvcc", "--version"]).encode())
+    sources = []
+    for pattern in ("*.py", "*.cpp", "*.cu", "*.cuh", "*.h", "*.hpp"):
+        sources.extend(glob.glob(os.path.join(ext_dir, "**", pattern), recursive=True))
+    for source in sorted(sources):
+        # Skip build artifacts (including .py files copied during install)
+        relpath = os.path.relpath(source, ext_dir)
+        if relpath.split(os.sep)[0] in ("build", "install", "dist"):
+            continue
+        hasher.update(relpath.encode())
+        with open(source, "rb") as f:
+            hasher.update(f.read())
+    return hasher.hexdigest()
+
+
+def _detect_cuda_arch_list():
+    """Arch list covering exactly the SMs present on this machine, without a
+    +PTX fallback, so the built extensions load as plain cubin instead of
+    being JIT-compiled from PTX at cuModuleLoadDataEx time."""
+    capabilities = {
+        torch.cuda.get_device_capability(i) for i in range(torch.cuda.device_count())
+    }
+    return ";".join(f"{major}.{minor}" for major, minor in sorted(capabilities))
+
+
 def _test_cpp_extensions_aot(test_directory, options, use_ninja):
     if use_ninja:
         try:
@@ -595,27 +649,63 @@ def _test_cpp_extensions_aot(test_directory, options, use_ninja):
             print(CPP_EXTENSIONS_ERROR)
             return 1
 
-    # Wipe the build folder, if it exists already
     cpp_extensions_test_dir = os.path.join(test_directory, "cpp_extensions")
-    cpp_extensions_test_build_dir = os.path.join(cpp_extensions_test_dir, "build")
-    if os.path.exists(cpp_extensions_test_build_dir):
-        shutil.rmtree(cpp_extensions_test_build_dir)
 
     # Build the test cpp extensions modules
     shell_env = os.environ.copy()
     shell_env["USE_NINJA"] = str(1 if use_ninja else 0)
+    if (
+        torch.cuda.is_available()
+        and not TEST_WITH_ROCM
+        and not shell_env.get("TORCH_CUDA_ARCH_LIST")
+    ):
+        shell_env["TORCH_CUDA_ARCH_LIST"] = _detect_cuda_arch_list()
     cmd = [sys.executable, "setup.py", "install", "--root", "./install"]
-    return_code = shell(cmd, cwd=cpp_extensions_test_dir, env=shell_env)
-    if return_code != 0:
-        return return_code
+    build_dirs = [cpp_extensions_test_dir]
     if sys.platform != "win32":
-        return_code = shell(
-            cmd,
-            cwd=os.path.join(cpp_extensions_test_dir, "no_python_abi_suffix_test"),
-            env=shell_env,
+        build_dirs.append(
+            os.path.join(cpp_extensions_test_dir, "no_python_abi_suffix_test")
         )
-        if return_code != 0:
-            return return_code
+
+    def build_extension(build_dir):
+        build_subdir = os.path.join(build_dir, "build")
+        stamp_file = os.path.join(build_subdir, ".stamp")
+        stamp = _cpp_extensions_aot_build_stamp(build_dir, shell_env)
+        # Only honor the stamp when the install tree is also still present;
+        # the test run below resolves modules out of install/, not build/.
+        if os.path.exists(stamp_file) and os.path.isdir(
+            os.path.join(build_dir, "install")
+        ):
+            with open(stamp_file) as f:
+                if f.read() == stamp:
+                    # Sources and toolchain are unchanged since the last
+                    # successful build; reuse the prebuilt extension.
+                    return 0
+        # Wipe the build folder, if it exists already
+        if os.path.exists(build_subdir):
+            shutil.rmtree(build_subdir)
+        return_code = shell(cmd, cwd=build_dir, env=shell_env)
+        if return_code == 0:
+            with open(stamp_file, "w") as f:
+                f.write(stamp)
+        return return_code
+
+    if os.getenv("PYTORCH_TEST_CPP_EXT_PARALLEL", "0") == "1":
+        # Each extension is an independent ninja target, so fan the builds out
+        # across a thread pool instead of compiling them back to back. Also ask
+        # nvcc to parallelize per-arch compilation within each .cu file.
+        shell_env.setdefault("NVCC_APPEND_FLAGS", "--threads 8")
+        num_workers = int(shell_env.get("MAX_JOBS", os.cpu_count()))
+        with ThreadPool(min(num_workers, len(build_dirs))) as pool:
+            return_codes = pool.map(build_extension, build_dirs)
+        for return_code in return_codes:
+            if return_code != 0:
+                return return_code
+    else:
+        for build_dir in build_dirs:
+            return_code = build_extension(build_dir)
+            if return_code != 0:
+                return return_code
 
     # "install" the test modules and run tests
     python_path = os.environ.get("PYTHONPATH", "")
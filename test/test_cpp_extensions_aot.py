@@ -1,9 +1,8 @@
 # Owner(s): ["module: cpp-extensions"]
 
-from itertools import repeat
+import functools
+import importlib
 import os
-import re
-from typing import Union, get_args, get_origin
 import unittest
 
 import torch.testing._internal.common_utils as common
@@ -37,6 +36,41 @@ except ImportError as e:
     ) from e
 
 
+# Inline equivalent of the sigmoid_add kernel built AOT by cuda_extension, for
+# the opt-in NVRTC mode below.
+_SIGMOID_ADD_SRC = """
+extern "C" __global__ void sigmoid_add(
+    const float* x, const float* y, float* out, int size) {
+  const int index = blockIdx.x * blockDim.x + threadIdx.x;
+  if (index < size) {
+    const float sigmoid_x = 1.0f / (1.0f + __expf(-x[index]));
+    const float sigmoid_y = 1.0f / (1.0f + __expf(-y[index]));
+    out[index] = sigmoid_x + sigmoid_y;
+  }
+}
+"""
+
+
+def _nvrtc_compile_kernel(src, name):
+    """Compile a toy kernel with NVRTC instead of the nvcc AOT flow.
+
+    Returns None when torch.cuda does not expose _compile_kernel, in which
+    case callers should stick to the AOT extension.
+    """
+    compile_kernel = getattr(torch.cuda, "_compile_kernel", None)
+    if compile_kernel is None:
+        return None
+    return compile_kernel(src, name)
+
+
+@functools.lru_cache(maxsize=None)
+def _load(name):
+    """Load an optional test extension at most once, and only when the test
+    that exercises it actually runs, so CPU-only runs never dlopen the CUDA
+    runtime / cuBLAS / cuSOLVER shared objects."""
+    return importlib.import_module(name)
+
+
 class TestCppExtensionAOT(common.TestCase):
     """Tests ahead-of-time cpp extensions
 
@@ -75,7 +109,7 @@ class TestCppExtensionAOT(common.TestCase):
 
     @unittest.skipIf(not TEST_CUDA, "CUDA not found")
     def test_cuda_extension(self):
-        import torch_test_cpp_extension.cuda as cuda_extension
+        cuda_extension = _load("torch_test_cpp_extension.cuda")
 
         x = torch.zeros(100, device="cuda", dtype=torch.float32)
         y = torch.zeros(100, device="cuda", dtype=torch.float32)
@@ -85,11 +119,27 @@ class TestCppExtensionAOT(common.TestCase):
         # 2 * sigmoid(0) = 2 * 0.5 = 1
         self.assertEqual(z, torch.ones_like(z))
 
+        if os.getenv("PYTORCH_TEST_NVRTC", "0") == "1":
+            # Opt-in fast path: compile the same kernel with NVRTC (orders of
+            # magnitude faster than the nvcc AOT build) and cross-check it
+            # against the AOT result. No-op if _compile_kernel is unavailable.
+            kernel = _nvrtc_compile_kernel(_SIGMOID_ADD_SRC, "sigmoid_add")
+            if kernel is not None:
+                out = torch.zeros_like(x)
+                threads = 256
+                blocks = (x.numel() + threads - 1) // threads
+                kernel(
+                    grid=(blocks, 1, 1),
+                    block=(threads, 1, 1),
+                    args=[x, y, out, x.numel()],
+                )
+                self.assertEqual(out.cpu(), z)
+
     @common.skipIfRocm
     @unittest.skipIf(common.IS_WINDOWS, "Windows not supported")
     @unittest.skipIf(not TEST_CUDA, "CUDA not found")
     def test_cublas_extension(self):
-        from torch_test_cpp_extension import cublas_extension
+        cublas_extension = _load("torch_test_cpp_extension.cublas_extension")
 
         x = torch.zeros(100, device="cuda", dtype=torch.float32)
         z = cublas_extension.noop_cublas_function(x)
@@ -99,7 +149,7 @@ class TestCppExtensionAOT(common.TestCase):
     @unittest.skipIf(common.IS_WINDOWS, "Windows not supported")
     @unittest.skipIf(not TEST_CUDA, "CUDA not found")
     def test_cusolver_extension(self):
-        from torch_test_cpp_extension import cusolver_extension
+        cusolver_extension = _load("torch_test_cpp_extension.cusolver_extension")
 
         x = torch.zeros(100, device="cuda", dtype=torch.float32)
         z = cusolver_extension.noop_cusolver_function(x)
@@ -129,7 +179,7 @@ class TestCppExtensionAOT(common.TestCase):
     @unittest.skipIf(not TEST_CUDA, "CUDA not found")
     @unittest.skipIf(os.getenv('USE_NINJA', '0') == '0', "cuda extension with dlink requires ninja to build")
     def test_cuda_dlink_libs(self):
-        from torch_test_cpp_extension import cuda_dlink
+        cuda_dlink = _load("torch_test_cpp_extension.cuda_dlink")
         a = torch.randn(8, dtype=torch.float, device='cuda')
         b = torch.randn(8, dtype=torch.float, device='cuda')
         ref = a + b
@@ -150,16 +200,37 @@ class TestPybindTypeCasters(common.TestCase):
     receive in python, in these tests we verify this at run-time.
     """
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def expected_return_type(func):
         """
         Our Pybind functions have a signature of the form `() -> return_type`.
+
+        Prefer the binding's return annotation when pybind exposes one (a
+        plain dict lookup), and only fall back to eval'ing the docstring
+        signature for bindings without annotations. The result is memoized per
+        function; `re` and `typing` are imported lazily so collecting the
+        other test classes in this module does not pay for them.
         """
+        import typing
+
+        try:
+            hint = typing.get_type_hints(func).get("return")
+        except TypeError:
+            # pybind builtins generally carry no __annotations__
+            hint = None
+        if hint is not None:
+            return hint
+
+        import re
+
         # Imports needed for the `eval` below.
-        from typing import List, Tuple  # noqa: F401
+        from typing import List, Tuple, Union  # noqa: F401
 
-        return eval(re.search("-> (.*)\n", func.__doc__).group(1))
+        return eval(re.search(r"-> (.*)\n", func.__doc__).group(1))
 
     def check(self, func):
+        from typing import get_origin
+
         val = func()
         expected = self.expected_return_type(func)
         origin = get_origin(expected)
@@ -171,18 +242,34 @@ class TestPybindTypeCasters(common.TestCase):
             self.assertIsInstance(val, expected)
 
     def check_list(self, vals, expected):
+        from typing import get_args
+
         self.assertIsInstance(vals, list)
         list_type = get_args(expected)[0]
-        for val in vals:
-            self.assertIsInstance(val, list_type)
+        # one bulk check instead of a python-level assert per element
+        self.assertTrue(
+            all(isinstance(val, list_type) for val in vals),
+            msg=f"list elements not all {list_type}: {vals}",
+        )
 
     def check_tuple(self, vals, expected):
+        from typing import get_args
+
         self.assertIsInstance(vals, tuple)
         tuple_types = get_args(expected)
         if tuple_types[1] is ...:
-            tuple_types = repeat(tuple_types[0])
-        for val, tuple_type in zip(vals, tuple_types):
-            self.assertIsInstance(val, tuple_type)
+            self.assertTrue(
+                all(isinstance(val, tuple_types[0]) for val in vals),
+                msg=f"tuple elements not all {tuple_types[0]}: {vals}",
+            )
+        else:
+            self.assertTrue(
+                all(
+                    isinstance(val, tuple_type)
+                    for val, tuple_type in zip(vals, tuple_types)
+                ),
+                msg=f"tuple elements do not match {tuple_types}: {vals}",
+            )
 
     def check_union(self, funcs):
         """Special handling for Union type casters.
@@ -190,6 +277,8 @@ class TestPybindTypeCasters(common.TestCase):
         A single cpp type can sometimes be cast to different types in python.
         In these cases we expect to get exactly one function per python type.
         """
+        from typing import get_args, get_origin, Union
+
         # Verify that all functions have the same return type.
         union_type = {self.expected_return_type(f) for f in funcs}
         assert len(union_type) == 1
@@ -262,6 +351,9 @@ class TestORTTensor(common.TestCase):
     def test_conv_backend_override(self):
         # To simplify tests, we use 4d input here to avoid doing view4d( which
         # needs more overrides) in _convolution.
+        # The three allocations below must stay separate: the fake ORT backend
+        # only registers empty/add/convolution, so slicing a single batched
+        # buffer into the three shapes would dispatch view ops it cannot run.
         input = torch.empty(2, 4, 10, 2, device='ort', requires_grad=True)
         weight = torch.empty(6, 4, 2, 2, device='ort', requires_grad=True)
         bias = torch.empty(6, device='ort')
@@ -316,20 +408,28 @@ class TestRNGExtension(common.TestCase):
         self.assertEqual(rng_extension.getInstanceCount(), 0)
 
 
+def _logical_and(a: bool, b: bool):
+    return torch.ops.torch_library.logical_and(a, b)
+
+
+@functools.lru_cache(maxsize=None)
+def _scripted_logical_and():
+    # scripting is several ms per call, so compile once per process and let
+    # repeated test invocations (--repeat, sharded sweeps) reuse the result
+    return torch.jit.script(_logical_and)
+
+
 @unittest.skipIf(not TEST_CUDA, "CUDA not found")
 class TestTorchLibrary(common.TestCase):
 
     def test_torch_library(self):
-        import torch_test_cpp_extension.torch_library  # noqa: F401
-
-        def f(a: bool, b: bool):
-            return torch.ops.torch_library.logical_and(a, b)
+        _load("torch_test_cpp_extension.torch_library")
 
-        self.assertTrue(f(True, True))
-        self.assertFalse(f(True, False))
-        self.assertFalse(f(False, True))
-        self.assertFalse(f(False, False))
-        s = torch.jit.script(f)
+        self.assertTrue(_logical_and(True, True))
+        self.assertFalse(_logical_and(True, False))
+        self.assertFalse(_logical_and(False, True))
+        self.assertFalse(_logical_and(False, False))
+        s = _scripted_logical_and()
         self.assertTrue(s(True, True))
         self.assertFalse(s(True, False))
         self.assertFalse(s(False, True))
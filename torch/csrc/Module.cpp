@@ -12,6 +12,7 @@
 #include <ATen/LegacyVmapMode.h>
 #include <ATen/LinalgBackend.h>
 #include <ATen/Parallel.h>
+#include <ATen/TensorUtils.h>
 #include <ATen/Utils.h>
 #include <ATen/core/Vitals.h>
 #include <ATen/dlpack.h>
@@ -1429,6 +1430,18 @@ PyObject* initModule() {
   py_module.def(
       "read_vitals", []() { return at::vitals::VitalsAPI.readVitals(); });
 
+  // Builds the (size, stride) metadata of a contiguous tensor in a single
+  // native call; used by the DTensor factory functions to skip several
+  // python frames per call.
+  py_module.def("_make_dtensor_meta", [](const std::vector<int64_t>& sizes) {
+    auto strides = at::detail::defaultStrides(sizes);
+    auto py_sizes = py::reinterpret_steal<py::object>(
+        THPSize_NewFromSizes(sizes.size(), sizes.data()));
+    auto py_strides = py::reinterpret_steal<py::object>(
+        THPSize_NewFromSizes(strides.size(), strides.data()));
+    return py::make_tuple(py_sizes, py_strides);
+  });
+
   py_module.def(
       "init_num_threads",
       torch::wrap_pybind_function(at::init_num_threads),
@@ -1,5 +1,6 @@
 # Copyright (c) Meta Platforms, Inc. and affiliates
-from typing import Callable, cast, Optional, Sequence
+import functools
+from typing import Callable, cast, Optional, Sequence, Tuple
 
 # Import all builtin dist tensor ops
 import torch
@@ -19,6 +20,114 @@ __all__ = [
     "Replicate",
 ]
 
+# Replicate is a stateless marker, so a single instance can be shared across
+# all default placements instead of constructing fresh ones per factory call.
+_REPLICATE = Replicate()
+_make_strides = torch._prims_common.make_contiguous_strides_for
+# Single native call building (torch.Size, contiguous strides); absent in
+# pure-python builds, in which case the factory falls back to _make_strides.
+_make_dtensor_meta = getattr(torch._C, "_make_dtensor_meta", None)
+
+
+@functools.lru_cache(maxsize=8)
+def _default_placements(ndim: int) -> Tuple[Placement, ...]:
+    return tuple(_REPLICATE for _ in range(ndim))
+
+
+def _validate_mesh_placements(
+    device_mesh: DeviceMesh, placement_types: Tuple[type, ...]
+) -> Tuple[str, bool]:
+    """
+    Validate a (mesh, placements) combination once and remember the bits the
+    factory hot path needs: the mesh device type and whether every placement
+    is Replicate. Repeat calls with the same combination (e.g. building many
+    optimizer states) reduce to a dict lookup. The cache lives on the mesh
+    instance itself so it never extends the lifetime of a DeviceMesh (and
+    the process groups it pins).
+    """
+    cache = getattr(device_mesh, "_factory_validation_cache", None)
+    if cache is None:
+        cache = {}
+        device_mesh._factory_validation_cache = cache
+    result = cache.get(placement_types)
+    if result is None:
+        assert device_mesh.ndim == len(
+            placement_types
+        ), "mesh dimension doesnot match the length of placements"
+        result = (
+            device_mesh.device_type,
+            all(p is Replicate for p in placement_types),
+        )
+        cache[placement_types] = result
+    return result
+
+
+def _dtensor_factory(
+    local_ctor: Callable[..., torch.Tensor],
+    size: Tuple[object, ...],
+    dtype: Optional[torch.dtype],
+    layout: torch.layout,
+    requires_grad: bool,
+    device_mesh: Optional[DeviceMesh],
+    placements: Optional[Sequence[Placement]],
+) -> DTensor:
+    """
+    Shared implementation for the DTensor factory functions: normalize the
+    size/mesh/placements arguments once, build the local shard with
+    ``local_ctor`` and wrap it in a :class:`DTensor`.
+    """
+    # if device_mesh is None, use the global one
+    device_mesh = get_global_device_mesh() if device_mesh is None else device_mesh
+    # set default placements to replicated if not specified
+    if placements is None:
+        placements = _default_placements(device_mesh.ndim)
+    device_type, all_replicate = _validate_mesh_placements(
+        device_mesh, tuple(type(p) for p in placements)
+    )
+    # DTensor specs compare placements with == against list literals, so
+    # always hand the DTensor a list (the cached default is a tuple)
+    placements = list(placements)
+
+    if len(size) == 1 and isinstance(size[0], (list, tuple)):
+        size = tuple(size[0])
+    assert layout == torch.strided, "layout value not supported!"
+    if _make_dtensor_meta is not None:
+        torch_size, torch_stride = _make_dtensor_meta(size)
+    else:
+        torch_size = torch.Size(size)
+        torch_stride = _make_strides(torch_size)
+
+    if all_replicate and device_mesh.get_coordinate() is not None:
+        # all-replicate is the common default; every rank holds the full
+        # tensor, so skip the mesh traversal in compute_local_shape
+        local_shape: Sequence[int] = torch_size
+    else:
+        local_shape = compute_local_shape(torch_size, device_mesh, placements)
+    if len(local_shape) == 0:
+        # rank is not part of the mesh; hold an empty shard on the mesh's
+        # device type without going through a python list conversion
+        local_tensor = torch.empty(0, dtype=dtype, device=device_type)
+        if requires_grad:
+            local_tensor.requires_grad_(True)
+    else:
+        local_tensor = local_ctor(
+            local_shape,
+            device=device_type,
+            dtype=dtype,
+            layout=layout,
+            requires_grad=requires_grad,
+        )
+
+    return DTensor(
+        local_tensor=local_tensor,
+        device_mesh=device_mesh,
+        placements=placements,
+        shape=torch_size,
+        dtype=local_tensor.dtype,
+        stride=torch_stride,
+        requires_grad=requires_grad,
+    )
+
 
 def zeros(
     *size,
@@ -48,43 +157,6 @@ def zeros(
     Returns:
         A :class:`DTensor` object on each rank
     """
-    # if device_mesh is None, use the global one
-    device_mesh = get_global_device_mesh() if device_mesh is None else device_mesh
-    # set default placements to replicated if not specified
-    if placements is None:
-        placements = [Replicate() for _ in range(device_mesh.ndim)]
-    assert device_mesh.ndim == len(
-        placements
-    ), "mesh dimension doesnot match the length of placements"
-
-    if len(size) == 1 and isinstance(size[0], Sequence):
-        torch_size = size[0]
-    else:
-        torch_size = list(size)
-    torch_size = torch.Size(torch_size)
-    assert layout == torch.strided, "layout value not supported!"
-    torch_stride = torch._prims_common.make_contiguous_strides_for(torch_size)
-
-    local_shape = compute_local_shape(torch_size, device_mesh, placements)
-    if len(local_shape) == 0:
-        local_tensor = torch.tensor([], dtype=dtype, requires_grad=requires_grad)
-    else:
-        local_tensor = torch.zeros(
-            local_shape,
-            device=device_mesh.device_type,
-            dtype=dtype,
-            layout=layout,
-            requires_grad=requires_grad,
-        )
-
-    dtensor = DTensor(
-        local_tensor=local_tensor,
-        device_mesh=device_mesh,
-        placements=placements,
-        shape=torch_size,
-        dtype=local_tensor.dtype,
-        stride=torch_stride,
-        requires_grad=requires_grad,
+    return _dtensor_factory(
+        torch.zeros, size, dtype, layout, requires_grad, device_mesh, placements
     )
-
-    return dtensor
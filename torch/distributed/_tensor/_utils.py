@@ -22,7 +22,9 @@ def compute_local_shape(
             mesh_dim_size = mesh.size(idx)
             my_coordinate = mesh.get_coordinate()
             assert my_coordinate is not None, "Rank not part of mesh!"
-            if isinstance(placement, Shard):
+            # exact type check, placement types are leaf classes and this
+            # loop runs per mesh dim on the factory hot path
+            if type(placement) is Shard:
                 shard_dim = placement.dim
                 assert (
                     shard_dim < ndim
@@ -55,7 +57,7 @@ def compute_local_offset(
             mesh_dim_size = mesh.size(idx)
             my_coordinate = mesh.get_coordinate()
             assert my_coordinate is not None, "Rank not part of mesh!"
-            if isinstance(placement, Shard):
+            if type(placement) is Shard:
                 shard_dim = placement.dim
                 assert shard_dim < len(
                     local_shape
@@ -1,5 +1,6 @@
 import copy
 import glob
+import hashlib
 import importlib
 import importlib.abc
 import os
@@ -591,6 +592,13 @@ class BuildExtension(build_ext):
                 # Put the original compiler back in place.
                 self.compiler.set_executable('compiler_so', original_compiler)
 
+        # Maps output dir -> subninja lines accumulated during this run. The
+        # top-level build.ninja is rewritten from this (rather than appended
+        # to) so lines for renamed or removed extensions — or a leftover
+        # normal-mode build.ninja from a previous run — never survive. See
+        # PYTORCH_CPP_EXT_SUBNINJA below.
+        subninja_lines: Dict[str, List[str]] = collections.defaultdict(list)
+
         def unix_wrap_ninja_compile(sources,
                                     output_dir=None,
                                     macros=None,
@@ -656,6 +664,28 @@ class BuildExtension(build_ext):
                 cuda_dlink_post_cflags = unix_cuda_flags(extra_postargs['nvcc_dlink'])
             else:
                 cuda_dlink_post_cflags = None
+
+            build_file_name = 'build.ninja'
+            if os.environ.get('PYTORCH_CPP_EXT_SUBNINJA', '0') == '1':
+                # Opt-in: give each extension its own ninja file instead of
+                # every extension overwriting <output_dir>/build.ninja, and
+                # keep a top-level file that subninjas all of them. The
+                # per-extension incremental state then survives multi-
+                # extension builds, and the whole set can be rebuilt with a
+                # single `ninja -f build.ninja` pass scheduling all targets
+                # at once.
+                source_tag = hashlib.sha256(
+                    ';'.join(sorted(sources)).encode()).hexdigest()[:8]
+                build_file_name = f'build.{source_tag}.ninja'
+                lines = subninja_lines[output_dir]
+                subninja_line = f'subninja {build_file_name}\n'
+                if subninja_line not in lines:
+                    lines.append(subninja_line)
+                # Rewrite the top-level file from the extensions seen in this
+                # run only, so it never references stale per-extension files.
+                with open(os.path.join(output_dir, 'build.ninja'), 'w') as f:
+                    f.writelines(lines)
+
             _write_ninja_file_and_compile_objects(
                 sources=sources,
                 objects=objects,
@@ -666,7 +696,8 @@ class BuildExtension(build_ext):
                 cuda_dlink_post_cflags=cuda_dlink_post_cflags,
                 build_directory=output_dir,
                 verbose=True,
-                with_cuda=with_cuda)
+                with_cuda=with_cuda,
+                build_file_name=build_file_name)
 
             # Return *all* object filenames, not just the ones we just built.
             return objects
@@ -1544,7 +1575,8 @@ def _write_ninja_file_and_compile_objects(
         cuda_dlink_post_cflags,
         build_directory: str,
         verbose: bool,
-        with_cuda: Optional[bool]) -> None:
+        with_cuda: Optional[bool],
+        build_file_name: str = 'build.ninja') -> None:
     verify_ninja_availability()
     if IS_WINDOWS:
         compiler = os.environ.get('CXX', 'cl')
@@ -1553,7 +1585,7 @@ def _write_ninja_file_and_compile_objects(
     get_compiler_abi_compatibility_and_version(compiler)
     if with_cuda is None:
         with_cuda = any(map(_is_cuda_file, sources))
-    build_file_path = os.path.join(build_directory, 'build.ninja')
+    build_file_path = os.path.join(build_directory, build_file_name)
     if verbose:
         print(f'Emitting ninja build file {build_file_path}...', file=sys.stderr)
     _write_ninja_file(
@@ -1575,7 +1607,8 @@ def _write_ninja_file_and_compile_objects(
         verbose,
         # It would be better if we could tell users the name of the extension
         # that failed to build but there isn't a good way to get it here.
-        error_prefix='Error compiling objects for extension')
+        error_prefix='Error compiling objects for extension',
+        build_file_name=build_file_name)
 
 
 def _write_ninja_file_and_build_library(
@@ -1855,8 +1888,11 @@ def _get_num_workers(verbose: bool) -> Optional[int]:
     return None
 
 
-def _run_ninja_build(build_directory: str, verbose: bool, error_prefix: str) -> None:
+def _run_ninja_build(build_directory: str, verbose: bool, error_prefix: str,
+                     build_file_name: str = 'build.ninja') -> None:
     command = ['ninja', '-v']
+    if build_file_name != 'build.ninja':
+        command.extend(['-f', build_file_name])
     num_workers = _get_num_workers(verbose)
     if num_workers is not None:
         command.extend(['-j', str(num_workers)])